@@ -0,0 +1,1158 @@
+#!/usr/bin/env python3
+"""
+🎯 Purn Realty Section Generator
+
+Intelligent Shopify section scaffolding for the Purn Realty theme.
+Analyzes a section type against section-intelligence-config.json and
+generates a ready-to-customize .liquid section plus matching CSS/JS
+assets with sensible, real-estate-focused defaults.
+
+Usage:
+    python section-generator.py --name property-hero --type hero
+"""
+
+import functools
+import io
+import json
+import os
+import sys
+from collections import ChainMap, namedtuple
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON shims: orjson is ~5-10x faster than the stdlib for both parse and
+# serialize, but stays optional — the stdlib paths below are equivalent.
+if orjson is not None:
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dump_indented(obj, buf):
+        buf.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8"))
+
+    def _json_dumps_bytes(obj):
+        return orjson.dumps(obj)
+else:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dump_indented(obj, buf):
+        json.dump(obj, buf, indent=2)
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# Static per-type lookup tables, hoisted to module scope so each call is a
+# single hash probe instead of rebuilding literals or walking an if/elif chain.
+_OPTIMIZATION_TIPS = MappingProxyType({
+    "hero": (
+        "Keep hero headlines under 60 characters for mobile readability",
+        "Use a single, clear call-to-action above the fold",
+        "Compress background images to under 300KB for fast loads",
+        "Test overlay opacity against real listing photos",
+    ),
+    "features": (
+        "Limit to 3-4 features per row to avoid visual clutter",
+        "Lead each feature with a concrete benefit, not a label",
+        "Use consistent icon styling across all cards",
+    ),
+    "testimonials": (
+        "Include client names and localities for credibility",
+        "Keep autoplay speed at 5 seconds or slower",
+        "Show star ratings only when most reviews are 4+ stars",
+    ),
+    "gallery": (
+        "Serve responsive image sizes via image_url filters",
+        "Enable the lightbox for property interior shots",
+        "Keep grid gaps consistent with the theme spacing scale",
+    ),
+})
+
+_DEFAULT_FOR_TYPE = MappingProxyType({
+    "text": "Default value",
+    "textarea": "",
+    "checkbox": False,
+    "range": 50,
+    "color": "#000000",
+    "select": "",
+    "url": "",
+    "image_picker": None,
+})
+
+# ----------------------------------------------------------------------
+# Section templates. All template bodies are static strings (the dynamic
+# parts are Liquid, rendered by Shopify, not Python), so they live at
+# module scope and generation is a dict lookup rather than a method
+# dispatch through per-call dicts of bound methods.
+# ----------------------------------------------------------------------
+
+_HERO_LIQUID = """<section class="generated-hero" style="min-height: {{ section.settings.height | default: 500 }}px;">
+  {% if section.settings.background_image %}
+    <div class="generated-hero__bg" style="background-image: url('{{ section.settings.background_image | image_url: width: 1920 }}');"></div>
+  {% endif %}
+  <div class="generated-hero__overlay" style="opacity: {{ section.settings.overlay_opacity | default: 40 | divided_by: 100.0 }};"></div>
+  <div class="container generated-hero__content" style="text-align: {{ section.settings.text_alignment | default: 'center' }};">
+    <h1>{{ section.settings.heading }}</h1>
+    <p>{{ section.settings.subheading }}</p>
+    {% if section.settings.button_text != blank %}
+      <a href="{{ section.settings.button_link }}" class="btn btn-primary">{{ section.settings.button_text }}</a>
+    {% endif %}
+  </div>
+</section>
+"""
+
+_FEATURES_LIQUID = """<section class="generated-features" style="background-color: {{ section.settings.background_color }};">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    {% if section.settings.subheading != blank %}
+      <p class="generated-features__subheading">{{ section.settings.subheading }}</p>
+    {% endif %}
+    <div class="generated-features__grid" style="grid-template-columns: repeat({{ section.settings.columns | default: 3 }}, 1fr);">
+      {% for block in section.blocks %}
+        <div class="generated-features__card" {{ block.shopify_attributes }}>
+          <h3>{{ block.settings.title }}</h3>
+          <p>{{ block.settings.text }}</p>
+        </div>
+      {% endfor %}
+    </div>
+  </div>
+</section>
+"""
+
+_TESTIMONIALS_LIQUID = """<section class="generated-testimonials"
+  data-autoplay="{{ section.settings.autoplay }}"
+  data-autoplay-speed="{{ section.settings.autoplay_speed | default: 5 }}">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    <div class="generated-testimonials__track">
+      {% for block in section.blocks %}
+        <div class="generated-testimonials__slide" {{ block.shopify_attributes }}>
+          {% if section.settings.show_ratings %}
+            <div class="generated-testimonials__stars">★★★★★</div>
+          {% endif %}
+          <blockquote>{{ block.settings.text }}</blockquote>
+          <cite>{{ block.settings.title }}</cite>
+        </div>
+      {% endfor %}
+    </div>
+  </div>
+</section>
+"""
+
+_GALLERY_LIQUID = """<section class="generated-gallery" data-lightbox="{{ section.settings.enable_lightbox }}">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    <div class="generated-gallery__grid"
+      style="grid-template-columns: repeat({{ section.settings.columns | default: 3 }}, 1fr); gap: {{ section.settings.gap | default: 16 }}px;">
+      {% for block in section.blocks %}
+        <figure class="generated-gallery__item generated-gallery__item--{{ section.settings.image_ratio | default: 'landscape' }}" {{ block.shopify_attributes }}>
+          <div class="generated-gallery__placeholder">{{ block.settings.title }}</div>
+        </figure>
+      {% endfor %}
+    </div>
+  </div>
+</section>
+"""
+
+_CTA_LIQUID = """<section class="generated-cta" style="background-color: {{ section.settings.background_color }};">
+  <div class="container generated-cta__inner">
+    <h2>{{ section.settings.heading }}</h2>
+    {% if section.settings.subheading != blank %}
+      <p>{{ section.settings.subheading }}</p>
+    {% endif %}
+    <div class="generated-cta__actions">
+      <a href="{{ section.settings.button_link }}" class="btn btn-primary">{{ section.settings.button_text }}</a>
+      {% if section.settings.show_whatsapp %}
+        <a href="https://wa.me/{{ settings.whatsapp_number }}" class="btn btn-outline">WhatsApp Us</a>
+      {% endif %}
+    </div>
+  </div>
+</section>
+"""
+
+_CONTACT_LIQUID = """<section class="generated-contact">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    {% form 'contact' %}
+      <input type="text" name="contact[name]" placeholder="Your Name" required>
+      <input type="tel" name="contact[phone]" placeholder="Phone Number" required>
+      {% if section.settings.form_fields != 'minimal' %}
+        <input type="email" name="contact[email]" placeholder="Email Address">
+        <textarea name="contact[body]" placeholder="How can we help?"></textarea>
+      {% endif %}
+      <button type="submit" class="btn btn-primary">Send Enquiry</button>
+    {% endform %}
+    {% if section.settings.whatsapp_number != blank %}
+      <a href="https://wa.me/{{ section.settings.whatsapp_number }}" class="btn btn-whatsapp">Chat on WhatsApp</a>
+    {% endif %}
+  </div>
+</section>
+"""
+
+_NEWSLETTER_LIQUID = """<section class="generated-newsletter generated-newsletter--{{ section.settings.layout | default: 'inline' }}">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    {% if section.settings.subheading != blank %}
+      <p>{{ section.settings.subheading }}</p>
+    {% endif %}
+    {% form 'customer' %}
+      <input type="hidden" name="contact[tags]" value="newsletter">
+      <input type="email" name="contact[email]" placeholder="{{ section.settings.placeholder }}" required>
+      <button type="submit" class="btn btn-primary">Subscribe</button>
+    {% endform %}
+  </div>
+</section>
+"""
+
+_STATS_LIQUID = """<section class="generated-stats" style="background-color: {{ section.settings.background_color }};"
+  data-animate="{{ section.settings.animate_counters }}"
+  data-duration="{{ section.settings.animation_duration | default: 2 }}">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    <div class="generated-stats__grid">
+      {% for block in section.blocks %}
+        <div class="generated-stats__item" {{ block.shopify_attributes }}>
+          <span class="generated-stats__number" data-target="{{ block.settings.title }}">0</span>
+          <span class="generated-stats__label">{{ block.settings.text }}</span>
+        </div>
+      {% endfor %}
+    </div>
+  </div>
+</section>
+"""
+
+_GENERIC_LIQUID = """<section class="generated-section" style="background-color: {{ section.settings.background_color }}; color: {{ section.settings.text_color }}; padding: {{ section.settings.padding | default: 40 }}px 0;">
+  <div class="container">
+    <h2>{{ section.settings.heading }}</h2>
+    <div class="generated-section__content">
+      {% for block in section.blocks %}
+        <div {{ block.shopify_attributes }}>{{ block.settings.text }}</div>
+      {% endfor %}
+    </div>
+  </div>
+</section>
+"""
+
+_HERO_CSS = """.generated-hero {
+  position: relative;
+  display: flex;
+  align-items: center;
+  overflow: hidden;
+}
+.generated-hero__bg {
+  position: absolute;
+  inset: 0;
+  background-size: cover;
+  background-position: center;
+}
+.generated-hero__overlay {
+  position: absolute;
+  inset: 0;
+  background: #000;
+}
+.generated-hero__content {
+  position: relative;
+  color: #fff;
+  z-index: 1;
+}
+"""
+
+_FEATURES_CSS = """.generated-features {
+  padding: 60px 0;
+}
+.generated-features__grid {
+  display: grid;
+  gap: 24px;
+  margin-top: 32px;
+}
+.generated-features__card {
+  background: #fff;
+  border-radius: 8px;
+  padding: 24px;
+  box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
+}
+@media (max-width: 768px) {
+  .generated-features__grid {
+    grid-template-columns: 1fr !important;
+  }
+}
+"""
+
+_TESTIMONIALS_CSS = """.generated-testimonials {
+  padding: 60px 0;
+  background: #f8f9fa;
+}
+.generated-testimonials__track {
+  display: flex;
+  overflow: hidden;
+  margin-top: 32px;
+}
+.generated-testimonials__slide {
+  flex: 0 0 100%;
+  text-align: center;
+  padding: 0 16px;
+  transition: transform 0.4s ease;
+}
+.generated-testimonials__stars {
+  color: #f5a623;
+  margin-bottom: 12px;
+}
+"""
+
+_GALLERY_CSS = """.generated-gallery {
+  padding: 60px 0;
+}
+.generated-gallery__grid {
+  display: grid;
+  margin-top: 32px;
+}
+.generated-gallery__item {
+  margin: 0;
+  border-radius: 8px;
+  overflow: hidden;
+  cursor: pointer;
+}
+.generated-gallery__item--square { aspect-ratio: 1; }
+.generated-gallery__item--landscape { aspect-ratio: 4 / 3; }
+.generated-gallery__item--portrait { aspect-ratio: 3 / 4; }
+.generated-gallery__placeholder {
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  height: 100%;
+  background: #e9ecef;
+}
+"""
+
+_GENERIC_CSS = """.generated-section {
+  padding: 40px 0;
+}
+.generated-section__content {
+  margin-top: 24px;
+}
+"""
+
+_TESTIMONIALS_JS = """document.addEventListener('DOMContentLoaded', function () {
+  document.querySelectorAll('.generated-testimonials').forEach(function (section) {
+    if (section.dataset.autoplay !== 'true') return;
+    var track = section.querySelector('.generated-testimonials__track');
+    var slides = track.children;
+    if (slides.length < 2) return;
+    var index = 0;
+    var speed = parseInt(section.dataset.autoplaySpeed, 10) * 1000 || 5000;
+    setInterval(function () {
+      index = (index + 1) % slides.length;
+      for (var i = 0; i < slides.length; i++) {
+        slides[i].style.transform = 'translateX(-' + index * 100 + '%)';
+      }
+    }, speed);
+  });
+});
+"""
+
+_GALLERY_JS = """document.addEventListener('DOMContentLoaded', function () {
+  document.querySelectorAll('.generated-gallery[data-lightbox="true"]').forEach(function (section) {
+    section.addEventListener('click', function (event) {
+      var item = event.target.closest('.generated-gallery__item');
+      if (item) item.classList.toggle('is-zoomed');
+    });
+  });
+});
+"""
+
+_STATS_JS = """document.addEventListener('DOMContentLoaded', function () {
+  document.querySelectorAll('.generated-stats[data-animate="true"]').forEach(function (section) {
+    var duration = (parseInt(section.dataset.duration, 10) || 2) * 1000;
+    var observer = new IntersectionObserver(function (entries) {
+      entries.forEach(function (entry) {
+        if (!entry.isIntersecting) return;
+        var el = entry.target;
+        var target = parseInt(el.dataset.target, 10) || 0;
+        var start = performance.now();
+        function tick(now) {
+          var progress = Math.min((now - start) / duration, 1);
+          el.textContent = Math.round(target * progress);
+          if (progress < 1) requestAnimationFrame(tick);
+        }
+        requestAnimationFrame(tick);
+        observer.unobserve(el);
+      });
+    });
+    section.querySelectorAll('.generated-stats__number').forEach(function (el) {
+      observer.observe(el);
+    });
+  });
+});
+"""
+
+_GENERIC_JS = """/* No behavior required for this section type. */
+"""
+
+# Default open() buffering (8 KiB on most platforms) is a lower bound, not
+# the optimum; a 128 KiB buffer lets each generated file go out in few
+# large writes instead of many small ones.
+_WRITE_BUFFER_SIZE = 131072
+
+_LIQUID_TEMPLATES = {
+    "hero": _HERO_LIQUID,
+    "features": _FEATURES_LIQUID,
+    "testimonials": _TESTIMONIALS_LIQUID,
+    "gallery": _GALLERY_LIQUID,
+    "cta": _CTA_LIQUID,
+    "contact": _CONTACT_LIQUID,
+    "newsletter": _NEWSLETTER_LIQUID,
+    "stats": _STATS_LIQUID,
+}
+
+_CSS_TEMPLATES = {
+    "hero": _HERO_CSS,
+    "features": _FEATURES_CSS,
+    "testimonials": _TESTIMONIALS_CSS,
+    "gallery": _GALLERY_CSS,
+}
+
+_JS_TEMPLATES = {
+    "testimonials": _TESTIMONIALS_JS,
+    "gallery": _GALLERY_JS,
+    "stats": _STATS_JS,
+}
+
+# Intern every template once at import so repeated generation hands out the
+# same underlying string objects and batch runs deduplicate in memory.
+for _table in (_LIQUID_TEMPLATES, _CSS_TEMPLATES, _JS_TEMPLATES):
+    for _type_name, _template in _table.items():
+        _table[_type_name] = sys.intern(_template)
+_GENERIC_LIQUID = sys.intern(_GENERIC_LIQUID)
+_GENERIC_CSS = sys.intern(_GENERIC_CSS)
+_GENERIC_JS = sys.intern(_GENERIC_JS)
+
+
+@dataclass(slots=True)
+class SectionConfig:
+    """Resolved configuration for a section about to be generated."""
+    name: str
+    type: str
+    description: str = ""
+    settings: list = field(default_factory=list)
+    blocks: list = field(default_factory=list)
+
+
+class GeneratedSection:
+    """A generated section whose liquid/CSS/JS content is produced lazily.
+
+    Consumers that only need one artifact (e.g. regenerating just the
+    schema) skip the work for the other two; save_section touches all
+    three, so the end-to-end CLI behavior is unchanged. Results are cached
+    in slots on first access. The analysis the section was generated from
+    rides along so callers can read derived fields (score, blocks, tips)
+    without re-running the analyzer.
+    """
+
+    __slots__ = ("config", "analysis", "_generator", "_liquid", "_css", "_js")
+
+    def __init__(self, config, generator, analysis=None):
+        self.config = config
+        self.analysis = analysis
+        self._generator = generator
+        self._liquid = None
+        self._css = None
+        self._js = None
+
+    @property
+    def liquid_content(self):
+        if self._liquid is None:
+            self._liquid = self._generator._generate_liquid(self.config)
+        return self._liquid
+
+    @property
+    def css_content(self):
+        if self._css is None:
+            self._css = self._generator._generate_css(self.config)
+        return self._css
+
+    @property
+    def js_content(self):
+        if self._js is None:
+            self._js = self._generator._generate_js(self.config)
+        return self._js
+
+
+@functools.lru_cache(maxsize=1)
+def _code_version_hash():
+    """Content hash of the analyzer source, so code edits invalidate the
+    on-disk analysis cache automatically."""
+    import hashlib
+    import inspect
+    return hashlib.md5(inspect.getsource(SectionTypeAnalyzer).encode()).hexdigest()[:8]
+
+
+VALID_TYPES = frozenset(
+    ("hero", "features", "testimonials", "gallery", "cta", "contact", "newsletter", "stats")
+)
+VALID_TYPES_STR = ", ".join(sorted(VALID_TYPES))
+
+_MISSING = object()
+
+# Shared read-only default for .get chains on the CLI report path; never
+# mutated, so one instance serves every call without allocation.
+_EMPTY = {}
+
+# Fully normalized, immutable per-type data baked once at config load so
+# analysis and generation are pointer-chasing over prepared tuples instead
+# of re-walking the JSON-shaped dicts per call.
+_PreparedType = namedtuple(
+    "_PreparedType", "essential recommended advanced suggested blocks score tips"
+)
+
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@functools.lru_cache(maxsize=1024)
+def _titleize(setting_id):
+    """Derive a display label from a setting id ('text_color' -> 'Text Color').
+
+    Section configs reuse the same handful of ids, so the cache hit rate is
+    near 100% and repeat derivations cost a single dict probe.
+    """
+    return setting_id.translate(_UNDERSCORE_TO_SPACE).title()
+
+# Type-specific extra keys for _normalize_setting, so the common path is a
+# single dict construction plus at most one extractor call.
+_TYPE_EXTRAS = {
+    "select": lambda s: {"options": s["options"]} if "options" in s else {},
+    "range": lambda s: {"min": s.get("min", 0), "max": s.get("max", 100), "unit": s.get("unit", "")},
+}
+
+# Parsed intelligence config shared across analyzer instances, keyed by
+# (path, mtime_ns) so an edited config is cheaply re-read.
+_CONFIG_CACHE = {}
+
+# Prepared per-type tables shared across analyzer instances, same keying.
+_PREPARED_CACHE = {}
+
+# Static pieces of the fallback analysis used when a section type has no
+# intelligence entry (or the config is missing entirely).
+_GENERIC_RECOMMENDED = (
+    {"type": "color", "id": "background_color", "label": "Background Color",
+     "default": "#ffffff", "required": False, "info": "", "category": "recommended"},
+    {"type": "color", "id": "text_color", "label": "Text Color",
+     "default": "#333333", "required": False, "info": "", "category": "recommended"},
+)
+
+_GENERIC_ADVANCED = (
+    {"type": "range", "id": "padding", "label": "Section Padding",
+     "default": 40, "required": False, "info": "", "category": "advanced",
+     "min": 0, "max": 120, "unit": "px"},
+)
+
+_GENERIC_TEMPLATE_BASE = {
+    "intelligence_score": 30,
+    "suggested_blocks": [],
+    "optimization_tips": [],
+    "commonUseCases": [],
+}
+
+
+class SectionTypeAnalyzer:
+    """Analyzes section types against the intelligence config and produces
+    organized, normalized settings with an intelligence score and tips."""
+
+    def __init__(self, config_path=None):
+        if config_path is None:
+            config_path = Path(__file__).parent / "section-intelligence-config.json"
+        self.config_path = str(config_path)
+        self.intelligence_config = self._load_intelligence_config()
+        try:
+            self._config_stamp = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            self._config_stamp = 0
+        self.section_types = self.intelligence_config.get("sectionTypes", {})
+        # Prepared per-type tables are immutable and deterministic per
+        # config version, so share them across analyzer instances: after
+        # the first analyzer, construction is two dict probes.
+        prepared_key = (self.config_path, self._config_stamp)
+        prepared = _PREPARED_CACHE.get(prepared_key)
+        if prepared is None:
+            prepared = {
+                name: self._prepare_type(name, cfg)
+                for name, cfg in self.section_types.items()
+            }
+            _PREPARED_CACHE[prepared_key] = prepared
+        self._prepared = prepared
+        # Analysis results are pure per section type, so cache them and
+        # make repeat lookups (batch generation, CLI + generator double
+        # analysis) a single dict probe instead of a full re-analysis.
+        self._cache: dict = {}
+
+    def _load_intelligence_config(self):
+        try:
+            key = (self.config_path, os.stat(self.config_path).st_mtime_ns)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is not None:
+                return cached
+            with open(self.config_path, "rb") as f:
+                config = _json_loads(f.read())
+            _CONFIG_CACHE[key] = config
+            return config
+        except (OSError, ValueError):
+            return {}
+
+    def analyze_section_type(self, section_type):
+        """Return the full analysis for a section type (cached).
+
+        Results are deterministic per (analyzer code, config) version, so
+        besides the in-memory cache they are persisted under
+        ~/.cache/realty/section-analysis/ and short-lived CLI runs reduce
+        the analyzer path to one small JSON read.
+        """
+        cached = self._cache.get(section_type)
+        if cached is not None:
+            return cached
+        analysis = self._load_cached_analysis(section_type)
+        if analysis is None:
+            if section_type in self.section_types:
+                analysis = self._get_intelligent_config(section_type)
+            else:
+                analysis = self._get_generic_config(section_type)
+            self._store_cached_analysis(section_type, analysis)
+        self._cache[section_type] = analysis
+        return analysis
+
+    def _analysis_cache_path(self, section_type):
+        return (Path.home() / ".cache" / "realty" / "section-analysis"
+                / f"{section_type}-{_code_version_hash()}-{self._config_stamp}.json")
+
+    def _load_cached_analysis(self, section_type):
+        try:
+            return _json_loads(self._analysis_cache_path(section_type).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_analysis(self, section_type, analysis):
+        try:
+            cache_path = self._analysis_cache_path(section_type)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_dumps_bytes(dict(analysis)))
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _prepare_type(self, section_type, section_config):
+        organized = self._organize_settings(section_config)
+        return _PreparedType(
+            essential=tuple(organized["essential"]),
+            recommended=tuple(organized["recommended"]),
+            advanced=tuple(organized["advanced"]),
+            suggested=tuple(organized["essential"] + organized["recommended"]),
+            blocks=tuple(section_config.get("suggestedBlocks", ())),
+            score=self._calculate_intelligence_score(section_config, organized),
+            tips=_OPTIMIZATION_TIPS.get(section_type, ()),
+        )
+
+    def _get_intelligent_config(self, section_type):
+        # Layer the prepared fields over the raw intelligence entry with a
+        # ChainMap instead of shallow-copying the whole entry just to
+        # update it; callers only read via [] / .get, which both support.
+        prepared = self._prepared[section_type]
+        derived = {
+            "intelligent_settings": {
+                "essential": prepared.essential,
+                "recommended": prepared.recommended,
+                "advanced": prepared.advanced,
+            },
+            "suggested_settings": prepared.suggested,
+            "advanced_settings": prepared.advanced,
+            "suggested_blocks": prepared.blocks,
+            "intelligence_score": prepared.score,
+            "optimization_tips": prepared.tips,
+        }
+        return ChainMap(derived, self.section_types[section_type])
+
+    def _organize_settings(self, section_config):
+        # List comprehensions use the interpreter's append fast path; the
+        # () defaults avoid allocating a fresh empty list per missing key.
+        return {
+            "essential": [self._normalize_setting(s) for s in section_config.get("essentialSettings", ())],
+            "recommended": [self._normalize_setting(s) for s in section_config.get("recommendedSettings", ())],
+            "advanced": [self._normalize_setting(s) for s in section_config.get("advancedSettings", ())],
+        }
+
+    def _normalize_setting(self, setting):
+        stype = setting.get("type", "text")
+        setting_id = setting.get("id") or setting.get("name", "setting")
+        normalized = {
+            "type": stype,
+            "id": setting_id,
+            "label": setting.get("label") or _titleize(setting_id),
+            "default": setting.get("default", _DEFAULT_FOR_TYPE.get(stype, "Default value")),
+            "required": setting.get("required", False),
+            "info": setting.get("info", ""),
+            "category": setting.get("category", "recommended"),
+        }
+        extras = _TYPE_EXTRAS.get(stype)
+        if extras:
+            normalized.update(extras(setting))
+        if "validation" in setting:
+            normalized["validation"] = setting["validation"]
+        return normalized
+
+    def _calculate_intelligence_score(self, section_config, organized):
+        score = section_config.get("baseScore", 40)
+        score += 4 * len(organized["essential"])
+        score += 3 * len(organized["recommended"])
+        score += 2 * len(organized["advanced"])
+        score += 3 * len(section_config.get("suggestedBlocks", []))
+        return min(score, 100)
+
+    def _get_generic_config(self, section_type):
+        # Only the heading setting and the description depend on the
+        # section type; everything else comes from the static module-level
+        # base instead of being re-literalized per call.
+        heading = {
+            "type": "text", "id": "heading", "label": "Section Heading",
+            "default": f"{section_type.title()} Section", "required": False,
+            "info": "", "category": "essential",
+        }
+        return {
+            **_GENERIC_TEMPLATE_BASE,
+            "description": f"Custom {section_type} section",
+            "essentialSettings": [heading],
+            "intelligent_settings": {
+                "essential": [heading],
+                "recommended": list(_GENERIC_RECOMMENDED),
+                "advanced": list(_GENERIC_ADVANCED),
+            },
+            "suggested_settings": [heading, *_GENERIC_RECOMMENDED],
+            "advanced_settings": list(_GENERIC_ADVANCED),
+        }
+
+
+class SectionGenerator:
+    """Generates Shopify section files (liquid + CSS + JS) for the theme."""
+
+    def __init__(self, theme_path="."):
+        self.theme_path = Path(theme_path)
+        self.analyzer = SectionTypeAnalyzer()
+
+    def generate_section(self, name, section_type, description=None, use_advanced=True, analysis=None):
+        if analysis is None:
+            analysis = self.analyzer.analyze_section_type(section_type)
+        settings = list(analysis.get("suggested_settings", []))
+        if use_advanced:
+            settings = settings + list(analysis.get("advanced_settings", []))
+        config = SectionConfig(
+            name=name,
+            type=section_type,
+            description=description or analysis.get("description", ""),
+            settings=settings,
+            blocks=list(analysis.get("suggested_blocks", [])),
+        )
+        return GeneratedSection(config, self, analysis)
+
+    # ------------------------------------------------------------------
+    # Liquid generation
+    # ------------------------------------------------------------------
+
+    def _generate_liquid(self, config):
+        schema = self._generate_intelligent_schema(config)
+        # Stream into one buffer and json.dump straight into it, instead of
+        # json.dumps + string concatenation which holds both the schema
+        # string and the combined result in memory at once.
+        essential_count = sum(1 for s in config.settings if s["category"] == "essential")
+        recommended_count = sum(1 for s in config.settings if s["category"] == "recommended")
+        advanced_count = sum(1 for s in config.settings if s["category"] == "advanced")
+        buf = io.StringIO()
+        buf.write(f"""<!-- Section Intelligence Info:
+  Type: {config.type}
+  Description: {config.description}
+  Essential settings: {essential_count}
+  Recommended settings: {recommended_count}
+  Advanced settings: {advanced_count}
+  Generated by section-generator.py
+-->
+""")
+        buf.write(self._generate_template_content(config))
+        buf.write("\n{% schema %}\n")
+        _json_dump_indented(schema, buf)
+        buf.write("\n{% endschema %}\n")
+        return buf.getvalue()
+
+    def _generate_intelligent_schema(self, config):
+        # Bucket by category in a single pass instead of three scans;
+        # _normalize_setting guarantees the "category" key is present.
+        essential, recommended, advanced = [], [], []
+        for s in config.settings:
+            cat = s["category"]
+            (essential if cat == "essential" else recommended if cat == "recommended" else advanced).append(s)
+        schema_settings = essential + recommended + advanced
+
+        schema = {
+            "name": config.name.replace("-", " ").title(),
+            "settings": [self._schema_setting(s) for s in schema_settings],
+        }
+        if config.blocks:
+            schema["blocks"] = [
+                {"type": b.get("type", "item"), "name": b.get("name", "Item"),
+                 "settings": [
+                     {"type": "text", "id": "title", "label": "Title"},
+                     {"type": "textarea", "id": "text", "label": "Text"},
+                 ]}
+                for b in config.blocks
+            ]
+            schema["max_blocks"] = max((b.get("limit", 10) for b in config.blocks), default=10)
+        schema["presets"] = [{
+            "name": config.name.replace("-", " ").title(),
+            "settings": self._get_preset_defaults(schema_settings),
+        }]
+        return schema
+
+    def _schema_setting(self, setting):
+        cleaned = {}
+        for key, value in setting.items():
+            if key in ("category", "required", "validation"):
+                continue
+            if value is None or value == "":
+                continue
+            cleaned[key] = value
+        return cleaned
+
+    def _get_preset_defaults(self, settings):
+        # Single .get probe per setting instead of an `in` check followed
+        # by a second lookup; the sentinel distinguishes a missing default
+        # from an explicit None.
+        return {
+            s["id"]: d
+            for s in settings
+            if (d := s.get("default", _MISSING)) is not _MISSING and d is not None
+        }
+
+    @staticmethod
+    def _generate_template_content(config):
+        return _LIQUID_TEMPLATES.get(config.type, _GENERIC_LIQUID)
+
+    # ------------------------------------------------------------------
+    # CSS generation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _generate_css(config):
+        return _CSS_TEMPLATES.get(config.type, _GENERIC_CSS)
+
+    # ------------------------------------------------------------------
+    # JS generation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _generate_js(config):
+        return _JS_TEMPLATES.get(config.type, _GENERIC_JS)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def save_section(self, generated, name):
+        sections_dir = self.theme_path / "sections"
+        sections_dir.mkdir(exist_ok=True)
+        assets_dir = self.theme_path / "assets"
+        assets_dir.mkdir(exist_ok=True)
+
+        liquid_file = sections_dir / f"{name}.liquid"
+        with open(liquid_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(generated.liquid_content)
+
+        css_file = assets_dir / f"{name}.css"
+        with open(css_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(generated.css_content)
+
+        js_file = assets_dir / f"{name}.js"
+        with open(js_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(generated.js_content)
+
+        return [liquid_file, css_file, js_file]
+
+    def save_many(self, items):
+        """Save many generated sections with directory setup done once.
+
+        Each item is a (name, GeneratedSection) tuple. Contents are
+        pre-encoded and written with Path.write_bytes, which skips the
+        TextIOWrapper layer and encodes each file in a single pass.
+        """
+        sections_dir = self.theme_path / "sections"
+        assets_dir = self.theme_path / "assets"
+        sections_dir.mkdir(exist_ok=True)
+        assets_dir.mkdir(exist_ok=True)
+        saved = []
+        for name, generated in items:
+            liquid_file = sections_dir / f"{name}.liquid"
+            liquid_file.write_bytes(generated.liquid_content.encode("utf-8"))
+            css_file = assets_dir / f"{name}.css"
+            css_file.write_bytes(generated.css_content.encode("utf-8"))
+            js_file = assets_dir / f"{name}.js"
+            js_file.write_bytes(generated.js_content.encode("utf-8"))
+            saved += [liquid_file, css_file, js_file]
+        return saved
+
+    def generate_many(self, specs):
+        """Generate many sections in parallel across CPU cores.
+
+        Each spec is a (name, section_type, description, use_advanced)
+        tuple. Generation is pure and independent per section, so it fans
+        out over a process pool; saving stays in the parent process.
+        """
+        # Deferred import: the single-section CLI path never pays for the
+        # concurrent.futures/multiprocessing module tree.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(str(self.theme_path),),
+        ) as executor:
+            return self.save_many(executor.map(_generate_worker, specs, chunksize=8))
+
+
+# Per-process generator for generate_many: built once per worker so each
+# process loads and analyzes the intelligence config a single time.
+_worker_generator = None
+
+
+def _init_worker(theme_path):
+    global _worker_generator
+    _worker_generator = SectionGenerator(theme_path)
+
+
+def _generate_worker(spec):
+    name, section_type, description, use_advanced = spec
+    section = _worker_generator.generate_section(
+        name, section_type, description, use_advanced=use_advanced
+    )
+    # Materialize in the worker so the CPU work happens in parallel rather
+    # than lazily in the parent during save_section.
+    section.liquid_content, section.css_content, section.js_content
+    return name, section
+
+
+_HELP_TEXT = f"""Usage: python section-generator.py --name NAME --type TYPE [options]
+
+🎯 Generate intelligent Shopify sections for the Purn Realty theme.
+
+Options:
+  --name NAME          Section file name (e.g. property-hero)
+  --type TYPE          Section type: {VALID_TYPES_STR}
+  --description TEXT   Optional custom section description
+  --theme-path PATH    Path to the theme root (default: .)
+  --basic              Skip advanced settings
+  --batch FILE         Generate every section listed in a JSON file
+                       ([{{"name": ..., "type": ..., "description": ...}}, ...])
+  --quiet              Skip the analysis report (default when stdout is not a TTY)
+  --force              Regenerate even if the section file already exists
+  -h, --help           Show this help and exit
+"""
+
+
+# Static pieces of the status report, precomputed so the emit path only
+# formats the genuinely dynamic lines. The fixed-shape header goes through
+# one format_map pass instead of a per-line f-string evaluation.
+_STATUS_TMPL = (
+    "🎯 Generating {type} section: '{name}'\n"
+    "📊 Intelligence Score: {score}/100\n"
+    "⚙️  Settings: {n_essential} essential, {n_recommended} recommended\n"
+    "🔧 Advanced: {n_advanced} available\n"
+    "🧩 Suggested blocks: {n_blocks}\n"
+)
+_TIPS_HEADER = "💡 Optimization Tips:\n"
+_FILES_HEADER = "📁 Files created:\n"
+_NEXT_STEPS = (
+    "\n🚀 Next Steps:\n"
+    "   1. Review the generated settings in the schema\n"
+    "   2. Add the section to a template via the theme editor\n"
+    "   3. Test in Shopify theme editor\n"
+)
+
+# Report buffer reused across main() calls, so batch drivers that invoke
+# main() in a loop amortize the buffer growth instead of reallocating it
+# per section.
+_REPORT_BUF = io.StringIO()
+
+
+def parse_args(argv):
+    """Parse the CLI's fixed flag shape with a direct argv walk.
+
+    argparse's import plus parser construction dominates runs of short
+    CLIs; this script has six rigid flags, so a hand-rolled walk keeps
+    startup lean.
+    """
+    args = SimpleNamespace(name=None, type=None, description=None,
+                           theme_path=".", advanced=True, batch=None,
+                           quiet=not sys.stdout.isatty(), force=False)
+    it = iter(argv)
+    for arg in it:
+        if arg == "--name":
+            args.name = next(it, None)
+        elif arg == "--type":
+            args.type = next(it, None)
+        elif arg == "--description":
+            args.description = next(it, None)
+        elif arg == "--theme-path":
+            args.theme_path = next(it, None)
+        elif arg == "--basic":
+            args.advanced = False
+        elif arg == "--batch":
+            args.batch = next(it, None)
+        elif arg == "--quiet":
+            args.quiet = True
+        elif arg == "--force":
+            args.force = True
+        elif arg in ("-h", "--help"):
+            sys.stdout.write(_HELP_TEXT)
+            raise SystemExit(0)
+        else:
+            sys.stderr.write(f"❌ Unknown argument: {arg}\n\n{_HELP_TEXT}")
+            raise SystemExit(2)
+    if not args.batch and (not args.name or not args.type):
+        sys.stderr.write(f"❌ --name and --type are required\n\n{_HELP_TEXT}")
+        raise SystemExit(2)
+    if args.type is not None and args.type not in VALID_TYPES:
+        sys.stderr.write(f"❌ Unknown section type '{args.type}'. Valid types: {VALID_TYPES_STR}\n")
+        raise SystemExit(2)
+    return args
+
+
+def _run_batch(args):
+    """Generate every section listed in a batch file within one process.
+
+    Reuses a single SectionGenerator (and therefore one analyzer with its
+    caches), so K sections of the same type pay for one analysis and one
+    config load instead of K CLI startups.
+    """
+    try:
+        rows = _json_loads(Path(args.batch).read_bytes())
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"❌ Could not read batch file '{args.batch}': {e}\n")
+        return 1
+
+    generator = SectionGenerator(args.theme_path)
+    analyzer = generator.analyzer
+    items = []
+    for row in rows:
+        name, section_type = row.get("name"), row.get("type")
+        if not name or section_type not in VALID_TYPES:
+            sys.stderr.write(f"❌ Invalid batch row: {row!r}. "
+                             f"Each row needs a name and a type from: {VALID_TYPES_STR}\n")
+            return 1
+        analysis = analyzer.analyze_section_type(section_type)
+        items.append((name, generator.generate_section(
+            name, section_type, row.get("description"),
+            use_advanced=args.advanced, analysis=analysis,
+        )))
+    files = generator.save_many(items)
+    if not args.quiet:
+        sys.stdout.write(f"✅ Generated {len(items)} sections ({len(files)} files)\n")
+        sys.stdout.flush()
+    return 0
+
+
+def main():
+    # Block-buffer stdout for the whole run: on a TTY each newline would
+    # otherwise trigger a flush syscall. The report paths flush explicitly
+    # once at the end; pipes are block-buffered already, so no regression.
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        pass
+
+    args = parse_args(sys.argv[1:])
+
+    if args.batch:
+        return _run_batch(args)
+
+    try:
+        # Up-to-date check first: a no-op re-run costs one stat() instead
+        # of a full analyze + generate + write cycle.
+        target = Path(args.theme_path) / "sections" / f"{args.name}.liquid"
+        if target.exists() and not args.force:
+            sys.stderr.write(f"⚠️  {target} already exists; use --force to regenerate\n")
+            return 0
+
+        # The analysis report is purely cosmetic; in quiet mode (scripts,
+        # CI pipelines) skip the explicit analyzer pass and all formatting,
+        # letting generate_section derive what it needs internally.
+        analysis = None
+        out = _REPORT_BUF
+        out.seek(0)
+        out.truncate()
+        if not args.quiet:
+            # Build the whole status report in memory and emit it with a
+            # single write: one syscall instead of ~15 line-flushed prints.
+            analyzer = SectionTypeAnalyzer()
+            analysis = analyzer.analyze_section_type(args.type)
+
+            settings = analysis.get("intelligent_settings") or _EMPTY
+            blocks = analysis.get("suggested_blocks") or ()
+            ctx = {
+                "type": args.type,
+                "name": args.name,
+                "score": analysis.get("intelligence_score", 0),
+                "n_blocks": len(blocks),
+            }
+            # One pass over the category names, feeding format_map directly.
+            ctx.update(
+                (f"n_{k}", len(settings.get(k, ())))
+                for k in ("essential", "recommended", "advanced")
+            )
+            out.write(_STATUS_TMPL.format_map(ctx))
+
+            if analysis.get("optimization_tips"):
+                out.write(_TIPS_HEADER)
+                for tip in islice(analysis["optimization_tips"], 3):
+                    out.write(f"   • {tip}\n")
+
+            if analysis.get("commonUseCases"):
+                out.write(f"💼 Common use cases: {', '.join(islice(analysis['commonUseCases'], 3))}\n")
+
+        generator = SectionGenerator(args.theme_path)
+        generated_section = generator.generate_section(
+            args.name, args.type, args.description, use_advanced=args.advanced,
+            analysis=analysis,
+        )
+        files = generator.save_section(generated_section, args.name)
+
+        if args.quiet:
+            return 0
+
+        out.write(f"✅ Section '{args.name}' generated successfully!\n")
+        out.write(_FILES_HEADER)
+        for path in files:
+            out.write(f"   {path}\n")
+        out.write(_NEXT_STEPS)
+        report = out.getvalue()
+        if sys.stdout.isatty():
+            # Keep TTY interleaving with anything else writing stdout.
+            sys.stdout.write(report)
+            sys.stdout.flush()
+        else:
+            # Pipe/file: skip the TextIOWrapper locking and incremental
+            # encoder and hand the kernel one pre-encoded write.
+            try:
+                sys.stdout.flush()
+                os.write(sys.stdout.fileno(), report.encode("utf-8"))
+            except (OSError, ValueError, io.UnsupportedOperation):
+                sys.stdout.write(report)
+        return 0
+    except Exception as e:
+        sys.stderr.write(f"❌ Error generating section: {e}\n")
+        if os.environ.get("REALTY_DEBUG"):
+            # Frame walking and linecache source reads are slow-path work;
+            # only pay for them when debugging is requested.
+            import traceback
+            traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())